@@ -10,6 +10,7 @@ Each command corresponds to an HTML element or style modification.
 
 from typing import List, Dict, Optional
 from html_generator import HTMLGenerator
+from limits import ResourceLimitError
 
 class WahyCommands:
     """Class containing all Wahy language commands."""
@@ -53,6 +54,8 @@ class WahyCommands:
             try:
                 self.command_map[command](args, generator)
                 return True
+            except ResourceLimitError:
+                raise
             except Exception as e:
                 raise Exception(f'خطأ في تنفيذ الأمر "{command}": {str(e)}')
         return False
@@ -9,16 +9,19 @@ It maintains the HTML structure and provides methods for adding elements.
 """
 
 from typing import List, Optional, Dict
+from limits import ResourceLimits
 
 class HTMLGenerator:
     """Generates HTML from Wahy commands."""
     
-    def __init__(self):
+    def __init__(self, limits: Optional[ResourceLimits] = None):
+        self.limits = limits or ResourceLimits()
         self.reset()
     
     def reset(self):
         """Reset the generator to initial state."""
         self.html_parts = []
+        self.output_size = 0  # Characters emitted so far, including separators
         self.page_opened = False
         self.page_closed = False
         self.styles = {}
@@ -35,26 +38,26 @@ class HTMLGenerator:
         if self.page_opened:
             raise Exception('الصفحة مفتوحة بالفعل')
         
-        self.html_parts.append('<!DOCTYPE html>')
-        self.html_parts.append('<html lang="ar" dir="rtl">')
-        self.html_parts.append('<head>')
-        self.html_parts.append('<meta charset="UTF-8">')
-        self.html_parts.append('<meta name="viewport" content="width=device-width, initial-scale=1.0">')
-        self.html_parts.append(f'<title>{self._escape_html(title)}</title>')
-        self.html_parts.append('<style>')
-        self.html_parts.append('body { font-family: "Arial", sans-serif; margin: 20px; padding: 20px; }')
-        self.html_parts.append('h1, h2, h3, h4, h5, h6 { color: #333; }')
-        self.html_parts.append('p { line-height: 1.6; margin: 10px 0; }')
-        self.html_parts.append('ul, ol { margin: 10px 0; padding-right: 20px; }')
-        self.html_parts.append('li { margin: 5px 0; }')
-        self.html_parts.append('a { color: #007bff; text-decoration: none; }')
-        self.html_parts.append('a:hover { text-decoration: underline; }')
-        self.html_parts.append('img { max-width: 100%; height: auto; margin: 10px 0; }')
-        self.html_parts.append('hr { margin: 20px 0; border: none; border-top: 1px solid #ddd; }')
-        self.html_parts.append('.section { margin: 20px 0; padding: 15px; border: 1px solid #eee; border-radius: 5px; }')
-        self.html_parts.append('</style>')
-        self.html_parts.append('</head>')
-        self.html_parts.append('<body>')
+        self._append('<!DOCTYPE html>')
+        self._append('<html lang="ar" dir="rtl">')
+        self._append('<head>')
+        self._append('<meta charset="UTF-8">')
+        self._append('<meta name="viewport" content="width=device-width, initial-scale=1.0">')
+        self._append(f'<title>{self._escape_html(title)}</title>')
+        self._append('<style>')
+        self._append('body { font-family: "Arial", sans-serif; margin: 20px; padding: 20px; }')
+        self._append('h1, h2, h3, h4, h5, h6 { color: #333; }')
+        self._append('p { line-height: 1.6; margin: 10px 0; }')
+        self._append('ul, ol { margin: 10px 0; padding-right: 20px; }')
+        self._append('li { margin: 5px 0; }')
+        self._append('a { color: #007bff; text-decoration: none; }')
+        self._append('a:hover { text-decoration: underline; }')
+        self._append('img { max-width: 100%; height: auto; margin: 10px 0; }')
+        self._append('hr { margin: 20px 0; border: none; border-top: 1px solid #ddd; }')
+        self._append('.section { margin: 20px 0; padding: 15px; border: 1px solid #eee; border-radius: 5px; }')
+        self._append('</style>')
+        self._append('</head>')
+        self._append('<body>')
         
         self.page_opened = True
     
@@ -69,25 +72,25 @@ class HTMLGenerator:
         while self.list_stack:
             list_type = self.list_stack.pop()
             if list_type == 'ul':
-                self.html_parts.append('</ul>')
+                self._append('</ul>')
             else:
-                self.html_parts.append('</ol>')
+                self._append('</ol>')
         
         # Close any open sections
         while self.section_stack:
             self.section_stack.pop()
-            self.html_parts.append('</div>')
+            self._append('</div>')
         
         # Add dynamic styles
         if self.styles:
-            self.html_parts.insert(-1, '<style>')
+            self._insert_before_last('<style>')
             for selector, properties in self.styles.items():
                 style_rules = '; '.join([f'{prop}: {value}' for prop, value in properties.items()])
-                self.html_parts.insert(-1, f'{selector} {{ {style_rules}; }}')
-            self.html_parts.insert(-1, '</style>')
+                self._insert_before_last(f'{selector} {{ {style_rules}; }}')
+            self._insert_before_last('</style>')
         
-        self.html_parts.append('</body>')
-        self.html_parts.append('</html>')
+        self._append('</body>')
+        self._append('</html>')
         
         self.page_closed = True
     
@@ -101,7 +104,7 @@ class HTMLGenerator:
         """
         self._ensure_page_open()
         level = max(1, min(6, level))  # Ensure level is between 1 and 6
-        self.html_parts.append(f'<h{level}>{self._escape_html(text)}</h{level}>')
+        self._append(f'<h{level}>{self._escape_html(text)}</h{level}>')
     
     def add_subheading(self, text: str):
         """Add a subheading (h2) to the page."""
@@ -115,7 +118,7 @@ class HTMLGenerator:
             text (str): Paragraph text
         """
         self._ensure_page_open()
-        self.html_parts.append(f'<p>{self._escape_html(text)}</p>')
+        self._append(f'<p>{self._escape_html(text)}</p>')
     
     def add_link(self, text: str, url: str):
         """
@@ -128,7 +131,7 @@ class HTMLGenerator:
         self._ensure_page_open()
         safe_url = self._escape_html(url)
         safe_text = self._escape_html(text)
-        self.html_parts.append(f'<a href="{safe_url}">{safe_text}</a>')
+        self._append(f'<a href="{safe_url}">{safe_text}</a>')
     
     def add_image(self, url: str, alt_text: str):
         """
@@ -141,18 +144,20 @@ class HTMLGenerator:
         self._ensure_page_open()
         safe_url = self._escape_html(url)
         safe_alt = self._escape_html(alt_text)
-        self.html_parts.append(f'<img src="{safe_url}" alt="{safe_alt}">')
+        self._append(f'<img src="{safe_url}" alt="{safe_alt}">')
     
     def start_list(self):
         """Start an unordered list."""
         self._ensure_page_open()
-        self.html_parts.append('<ul>')
+        self.limits.check_nesting_depth(self._nesting_depth() + 1)
+        self._append('<ul>')
         self.list_stack.append('ul')
     
     def start_ordered_list(self):
         """Start an ordered list."""
         self._ensure_page_open()
-        self.html_parts.append('<ol>')
+        self.limits.check_nesting_depth(self._nesting_depth() + 1)
+        self._append('<ol>')
         self.list_stack.append('ol')
     
     def end_list(self):
@@ -163,9 +168,9 @@ class HTMLGenerator:
         
         list_type = self.list_stack.pop()
         if list_type == 'ul':
-            self.html_parts.append('</ul>')
+            self._append('</ul>')
         else:
-            self.html_parts.append('</ol>')
+            self._append('</ol>')
     
     def end_ordered_list(self):
         """End the current ordered list (alias for end_list)."""
@@ -182,17 +187,17 @@ class HTMLGenerator:
         if not self.list_stack:
             raise Exception('لا توجد قائمة مفتوحة لإضافة عنصر إليها')
         
-        self.html_parts.append(f'<li>{self._escape_html(text)}</li>')
+        self._append(f'<li>{self._escape_html(text)}</li>')
     
     def add_horizontal_rule(self):
         """Add a horizontal rule."""
         self._ensure_page_open()
-        self.html_parts.append('<hr>')
+        self._append('<hr>')
     
     def add_space(self):
         """Add a line break."""
         self._ensure_page_open()
-        self.html_parts.append('<br>')
+        self._append('<br>')
     
     def start_section(self, css_class: Optional[str] = None):
         """
@@ -202,10 +207,11 @@ class HTMLGenerator:
             css_class (Optional[str]): CSS class for the section
         """
         self._ensure_page_open()
+        self.limits.check_nesting_depth(self._nesting_depth() + 1)
         if css_class:
-            self.html_parts.append(f'<div class="{self._escape_html(css_class)}>')
+            self._append(f'<div class="{self._escape_html(css_class)}>')
         else:
-            self.html_parts.append('<div class="section">')
+            self._append('<div class="section">')
         self.section_stack.append(css_class or 'section')
     
     def end_section(self):
@@ -215,7 +221,7 @@ class HTMLGenerator:
             raise Exception('لا يوجد قسم مفتوح لإنهائه')
         
         self.section_stack.pop()
-        self.html_parts.append('</div>')
+        self._append('</div>')
     
     def change_background_color(self, color: str):
         """
@@ -278,6 +284,25 @@ class HTMLGenerator:
         if self.page_closed:
             raise Exception('الصفحة مغلقة. لا يمكن إضافة محتوى جديد')
     
+    def _nesting_depth(self) -> int:
+        """Return the number of currently open lists and sections combined."""
+        return len(self.list_stack) + len(self.section_stack)
+    
+    def _append(self, part: str):
+        """Append a part to the output, enforcing the output size limit."""
+        self._count_output(part)
+        self.html_parts.append(part)
+    
+    def _insert_before_last(self, part: str):
+        """Insert a part before the last one, enforcing the output size limit."""
+        self._count_output(part)
+        self.html_parts.insert(-1, part)
+    
+    def _count_output(self, part: str):
+        """Account for a part (plus its newline separator) in the output size."""
+        self.output_size += len(part) + 1
+        self.limits.check_output_size(self.output_size)
+    
     def _escape_html(self, text: str) -> str:
         """
         Escape HTML special characters.
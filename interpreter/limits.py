@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Resource Limits for Wahy Language
+=================================
+
+This module defines the resource limits applied while compiling Wahy code.
+The playground compiles untrusted input, so every compile is bounded in
+source size, nesting depth, output size and wall-clock time.
+"""
+
+import os
+import time
+
+# Error codes reported in the 'errorCode' field of a failed result
+LINE_COUNT_EXCEEDED = 'LINE_COUNT_EXCEEDED'
+LINE_LENGTH_EXCEEDED = 'LINE_LENGTH_EXCEEDED'
+NESTING_DEPTH_EXCEEDED = 'NESTING_DEPTH_EXCEEDED'
+OUTPUT_SIZE_EXCEEDED = 'OUTPUT_SIZE_EXCEEDED'
+TIME_LIMIT_EXCEEDED = 'TIME_LIMIT_EXCEEDED'
+
+# Environment variables read by ResourceLimits.from_env()
+ENV_MAX_LINES = 'WAHY_MAX_LINES'
+ENV_MAX_LINE_LENGTH = 'WAHY_MAX_LINE_LENGTH'
+ENV_MAX_NESTING_DEPTH = 'WAHY_MAX_NESTING_DEPTH'
+ENV_MAX_OUTPUT_SIZE = 'WAHY_MAX_OUTPUT_SIZE'
+ENV_MAX_COMPILE_SECONDS = 'WAHY_MAX_COMPILE_SECONDS'
+
+
+class ResourceLimitError(Exception):
+    """Raised when a compile exceeds one of its resource limits."""
+
+    def __init__(self, code: str, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+class ResourceLimits:
+    """
+    Configurable resource limits for a single compile.
+    
+    Instances hold configuration only and are never mutated while compiling,
+    so one instance can be shared by several interpreters.
+    """
+
+    def __init__(self,
+                 max_lines: int = 5000,
+                 max_line_length: int = 10000,
+                 max_nesting_depth: int = 32,
+                 max_output_size: int = 2 * 1024 * 1024,
+                 max_compile_seconds: float = 2.0):
+        """
+        Args:
+            max_lines (int): Maximum number of source lines
+            max_line_length (int): Maximum number of characters per source line
+            max_nesting_depth (int): Maximum combined depth of nested lists and sections
+            max_output_size (int): Maximum number of characters of generated HTML
+            max_compile_seconds (float): Wall-clock budget for one compile
+        """
+        self.max_lines = max_lines
+        self.max_line_length = max_line_length
+        self.max_nesting_depth = max_nesting_depth
+        self.max_output_size = max_output_size
+        self.max_compile_seconds = max_compile_seconds
+
+    @classmethod
+    def from_env(cls) -> 'ResourceLimits':
+        """
+        Build limits from WAHY_MAX_* environment variables.
+        
+        Variables that are not set keep their default value.
+        
+        Returns:
+            ResourceLimits: Limits configured from the environment
+        """
+        defaults = cls()
+        return cls(
+            max_lines=int(os.environ.get(ENV_MAX_LINES, defaults.max_lines)),
+            max_line_length=int(os.environ.get(ENV_MAX_LINE_LENGTH, defaults.max_line_length)),
+            max_nesting_depth=int(os.environ.get(ENV_MAX_NESTING_DEPTH, defaults.max_nesting_depth)),
+            max_output_size=int(os.environ.get(ENV_MAX_OUTPUT_SIZE, defaults.max_output_size)),
+            max_compile_seconds=float(os.environ.get(ENV_MAX_COMPILE_SECONDS, defaults.max_compile_seconds)),
+        )
+
+    def new_deadline(self) -> float:
+        """Return the wall-clock deadline for a compile starting now."""
+        return time.monotonic() + self.max_compile_seconds
+
+    def check_line_count(self, count: int):
+        """Ensure the source does not have too many lines."""
+        if count > self.max_lines:
+            raise ResourceLimitError(
+                LINE_COUNT_EXCEEDED,
+                f'عدد الأسطر ({count}) يتجاوز الحد المسموح ({self.max_lines})'
+            )
+
+    def check_line_length(self, line: str):
+        """Ensure a single source line, excluding its line ending, is not too long."""
+        if len(line.rstrip('\r\n')) > self.max_line_length:
+            raise ResourceLimitError(
+                LINE_LENGTH_EXCEEDED,
+                f'طول السطر يتجاوز الحد المسموح ({self.max_line_length} حرف)'
+            )
+
+    def check_nesting_depth(self, depth: int):
+        """Ensure lists and sections are not nested too deeply."""
+        if depth > self.max_nesting_depth:
+            raise ResourceLimitError(
+                NESTING_DEPTH_EXCEEDED,
+                f'عمق التداخل يتجاوز الحد المسموح ({self.max_nesting_depth})'
+            )
+
+    def check_output_size(self, size: int):
+        """Ensure the generated HTML does not grow too large."""
+        if size > self.max_output_size:
+            raise ResourceLimitError(
+                OUTPUT_SIZE_EXCEEDED,
+                f'حجم الصفحة الناتجة يتجاوز الحد المسموح ({self.max_output_size} حرف)'
+            )
+
+    def check_time(self, deadline: float):
+        """Ensure the compile has not passed its wall-clock deadline."""
+        if time.monotonic() > deadline:
+            raise ResourceLimitError(
+                TIME_LIMIT_EXCEEDED,
+                f'تجاوزت الترجمة الوقت المسموح ({self.max_compile_seconds} ثانية)'
+            )
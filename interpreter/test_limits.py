@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tests for the Wahy resource limits.
+"""
+
+import pytest
+
+from commands import WahyCommands
+from html_generator import HTMLGenerator
+from limits import (
+    ResourceLimits,
+    ResourceLimitError,
+    LINE_COUNT_EXCEEDED,
+    LINE_LENGTH_EXCEEDED,
+    NESTING_DEPTH_EXCEEDED,
+    OUTPUT_SIZE_EXCEEDED,
+    TIME_LIMIT_EXCEEDED,
+)
+from wahy_interpreter import WahyInterpreter
+
+OPEN_PAGE = 'افتح صفحة "تجربة"'
+CLOSE_PAGE = 'أغلق صفحة'
+START_LIST = 'ابدأ قائمة'
+END_LIST = 'أنهِ قائمة'
+START_SECTION = 'ابدأ قسم'
+END_SECTION = 'أنهِ قسم'
+
+
+def page(*body):
+    return [OPEN_PAGE, *body, CLOSE_PAGE]
+
+
+def test_line_count_exceeded():
+    interpreter = WahyInterpreter(ResourceLimits(max_lines=3))
+    result = interpreter.interpret_code(page('# 1', '# 2'))
+    assert result['success'] is False
+    assert result['errorCode'] == LINE_COUNT_EXCEEDED
+    assert result['lineNumber'] == 0
+
+
+def test_line_length_exceeded():
+    interpreter = WahyInterpreter(ResourceLimits(max_line_length=20))
+    result = interpreter.interpret_code(page('أضف فقرة "' + 'ا' * 30 + '"'))
+    assert result['errorCode'] == LINE_LENGTH_EXCEEDED
+    assert result['lineNumber'] == 2
+
+
+def test_line_ending_does_not_count_towards_length():
+    interpreter = WahyInterpreter(ResourceLimits(max_line_length=len(OPEN_PAGE)))
+    result = interpreter.interpret_code([OPEN_PAGE + '\n', CLOSE_PAGE + '\r\n'])
+    assert result['success'] is True
+
+
+def test_nesting_depth_exceeded():
+    interpreter = WahyInterpreter(ResourceLimits(max_nesting_depth=2))
+    result = interpreter.interpret_code(page(START_LIST, START_LIST, START_LIST))
+    assert result['errorCode'] == NESTING_DEPTH_EXCEEDED
+    assert result['lineNumber'] == 4
+
+
+def test_nesting_depth_counts_lists_and_sections_together():
+    interpreter = WahyInterpreter(ResourceLimits(max_nesting_depth=2))
+    result = interpreter.interpret_code(page(START_SECTION, START_LIST, START_SECTION))
+    assert result['errorCode'] == NESTING_DEPTH_EXCEEDED
+    assert result['lineNumber'] == 4
+
+
+def test_output_size_exceeded():
+    interpreter = WahyInterpreter(ResourceLimits(max_output_size=1000))
+    result = interpreter.interpret_code(page(*['أضف فقرة "نص"'] * 100))
+    assert result['errorCode'] == OUTPUT_SIZE_EXCEEDED
+    assert result['lineNumber'] > 1
+
+
+def test_time_limit_exceeded():
+    interpreter = WahyInterpreter(ResourceLimits(max_compile_seconds=-1))
+    result = interpreter.interpret_code(page())
+    assert result['errorCode'] == TIME_LIMIT_EXCEEDED
+    assert result['lineNumber'] == 1
+
+
+def test_compile_just_under_limits_succeeds():
+    code = page(START_SECTION, START_LIST, 'أضف عنصر "أ"', END_LIST, END_SECTION)
+    html = WahyInterpreter().interpret_code(code)['html']
+    limits = ResourceLimits(
+        max_lines=len(code),
+        max_line_length=max(len(line) for line in code),
+        max_nesting_depth=2,
+        max_output_size=len(html) + 1,
+    )
+    result = WahyInterpreter(limits).interpret_code(code)
+    assert result == {'success': True, 'html': html}
+
+
+def test_shared_limits_do_not_leak_between_interpreters():
+    limits = ResourceLimits(max_nesting_depth=1)
+    first = WahyInterpreter(limits)
+    second = WahyInterpreter(limits)
+    assert first.interpret_code(page(START_LIST, START_LIST))['errorCode'] == NESTING_DEPTH_EXCEEDED
+    assert second.interpret_code(page(START_LIST, END_LIST))['success'] is True
+
+
+def test_limit_error_propagates_through_execute_command():
+    generator = HTMLGenerator(ResourceLimits(max_nesting_depth=0))
+    commands = WahyCommands()
+    commands.execute_command('افتح صفحة', ['تجربة'], generator)
+    with pytest.raises(ResourceLimitError) as info:
+        commands.execute_command(START_LIST, [], generator)
+    assert info.value.code == NESTING_DEPTH_EXCEEDED
+
+
+def test_interpret_file_with_too_many_lines(tmp_path):
+    source = tmp_path / 'long.wahy'
+    source.write_text('\n'.join(page(*['# تعليق'] * 50)), encoding='utf-8')
+    result = WahyInterpreter(ResourceLimits(max_lines=10)).interpret_file(str(source))
+    assert result['errorCode'] == LINE_COUNT_EXCEEDED
+
+
+def test_interpret_file_with_long_line(tmp_path):
+    source = tmp_path / 'wide.wahy'
+    source.write_text(OPEN_PAGE + '\n# ' + 'ا' * 500 + '\n' + CLOSE_PAGE, encoding='utf-8')
+    result = WahyInterpreter(ResourceLimits(max_line_length=100)).interpret_file(str(source))
+    assert result['errorCode'] == LINE_LENGTH_EXCEEDED
+    assert result['lineNumber'] == 2
+
+
+def test_limits_from_env(monkeypatch):
+    monkeypatch.setenv('WAHY_MAX_LINES', '7')
+    monkeypatch.setenv('WAHY_MAX_COMPILE_SECONDS', '0.5')
+    limits = ResourceLimits.from_env()
+    assert limits.max_lines == 7
+    assert limits.max_compile_seconds == 0.5
+    assert limits.max_nesting_depth == ResourceLimits().max_nesting_depth
@@ -17,13 +17,15 @@ import re
 from typing import Dict, List, Optional, Tuple
 from commands import WahyCommands
 from html_generator import HTMLGenerator
+from limits import ResourceLimits, ResourceLimitError
 
 class WahyInterpreter:
     """Main interpreter class for the Wahy programming language."""
     
-    def __init__(self):
+    def __init__(self, limits: Optional[ResourceLimits] = None):
+        self.limits = limits or ResourceLimits()
         self.commands = WahyCommands()
-        self.html_generator = HTMLGenerator()
+        self.html_generator = HTMLGenerator(self.limits)
         self.current_line = 0
         self.errors = []
         
@@ -92,10 +94,12 @@ class WahyInterpreter:
         """
         try:
             with open(filepath, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+                lines = self._read_bounded_lines(file)
                 
             return self.interpret_code(lines)
             
+        except ResourceLimitError as e:
+            return self._limit_error(e, self.current_line)
         except FileNotFoundError:
             return {
                 'success': False,
@@ -115,6 +119,30 @@ class WahyInterpreter:
                 'lineNumber': 0
             }
     
+    def _read_bounded_lines(self, file) -> List[str]:
+        """
+        Read source lines without ever holding more than the limits allow.
+        
+        Each read is capped just past the line length limit, and reading stops
+        one line past the line count limit, so oversized files abort early.
+        
+        Args:
+            file: Text file opened for reading
+            
+        Returns:
+            List[str]: Lines read, at most one more than the line count limit
+        """
+        self.current_line = 0
+        lines = []
+        while len(lines) <= self.limits.max_lines:
+            line = file.readline(self.limits.max_line_length + 2)
+            if not line:
+                break
+            self.current_line = len(lines) + 1
+            self.limits.check_line_length(line)
+            lines.append(line)
+        return lines
+    
     def interpret_code(self, lines: List[str]) -> Dict:
         """
         Interpret Wahy code lines and generate HTML.
@@ -128,10 +156,22 @@ class WahyInterpreter:
         self.current_line = 0
         self.errors = []
         self.html_generator.reset()
+        deadline = self.limits.new_deadline()
+        
+        try:
+            self.limits.check_line_count(len(lines))
+        except ResourceLimitError as e:
+            return self._limit_error(e, 0)
         
         for i, line in enumerate(lines):
             self.current_line = i + 1
             
+            try:
+                self.limits.check_time(deadline)
+                self.limits.check_line_length(line)
+            except ResourceLimitError as e:
+                return self._limit_error(e, self.current_line)
+            
             parsed = self.parse_command(line)
             if parsed is None:
                 continue
@@ -146,6 +186,8 @@ class WahyInterpreter:
                         'error': error_msg,
                         'lineNumber': self.current_line
                     }
+            except ResourceLimitError as e:
+                return self._limit_error(e, self.current_line)
             except Exception as e:
                 return {
                     'success': False,
@@ -167,6 +209,24 @@ class WahyInterpreter:
             'success': True,
             'html': html_output
         }
+    
+    def _limit_error(self, error: ResourceLimitError, line_number: int) -> Dict:
+        """
+        Build the result for a compile aborted by a resource limit.
+        
+        Args:
+            error (ResourceLimitError): The exceeded limit
+            line_number (int): Line at which the compile was aborted
+            
+        Returns:
+            Dict: Failed result including the limit's error code
+        """
+        return {
+            'success': False,
+            'error': str(error),
+            'errorCode': error.code,
+            'lineNumber': line_number
+        }
 
 def main():
     """Main function to run the interpreter from command line."""
@@ -178,7 +238,16 @@ def main():
         sys.exit(1)
     
     filepath = sys.argv[1]
-    interpreter = WahyInterpreter()
+    try:
+        limits = ResourceLimits.from_env()
+    except ValueError as e:
+        print(json.dumps({
+            'success': False,
+            'error': f'قيمة غير صالحة لحدود الموارد: {str(e)}'
+        }, ensure_ascii=False))
+        sys.exit(1)
+    
+    interpreter = WahyInterpreter(limits)
     result = interpreter.interpret_file(filepath)
     
     print(json.dumps(result, ensure_ascii=False, indent=2))
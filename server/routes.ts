@@ -122,7 +122,7 @@ export async function registerRoutes(app: Express): Promise<Server> {
         res.setHeader('Content-Disposition', `attachment; filename="${filename || 'output.html'}"`);
         res.send(result.html);
       } else {
-        res.status(400).json({ error: result.error || "Failed to generate HTML" });
+        res.status(400).json({ error: result.error || "Failed to generate HTML", errorCode: result.errorCode });
       }
 
     } catch (error) {
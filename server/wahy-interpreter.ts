@@ -16,20 +16,64 @@ interface InterpretationResult {
   combinedOutput?: string;
   error?: string;
   lineNumber?: number;
+  errorCode?: ResourceLimitCode;
   type?: 'html' | 'css' | 'javascript' | 'mixed';
   warnings?: string[];
 }
 
+type ResourceLimitCode =
+  | 'LINE_COUNT_EXCEEDED'
+  | 'LINE_LENGTH_EXCEEDED'
+  | 'NESTING_DEPTH_EXCEEDED'
+  | 'OUTPUT_SIZE_EXCEEDED'
+  | 'TIME_LIMIT_EXCEEDED';
+
+/**
+ * Resource limits for a single compile of untrusted playground code.
+ * Limits are configuration only and are never mutated while compiling.
+ */
+export interface ResourceLimits {
+  maxLines: number;
+  maxLineLength: number;
+  maxNestingDepth: number; // Combined depth of open lists and sections
+  maxOutputSize: number; // Characters of generated HTML
+  maxCompileMs: number;
+}
+
+function readLimitFromEnv(name: string, fallback: number): number {
+  const value = Number(process.env[name]);
+  return Number.isFinite(value) && value > 0 ? value : fallback;
+}
+
+export const DEFAULT_RESOURCE_LIMITS: ResourceLimits = {
+  maxLines: readLimitFromEnv('WAHY_MAX_LINES', 5000),
+  maxLineLength: readLimitFromEnv('WAHY_MAX_LINE_LENGTH', 10000),
+  maxNestingDepth: readLimitFromEnv('WAHY_MAX_NESTING_DEPTH', 32),
+  maxOutputSize: readLimitFromEnv('WAHY_MAX_OUTPUT_SIZE', 2 * 1024 * 1024),
+  maxCompileMs: readLimitFromEnv('WAHY_MAX_COMPILE_SECONDS', 2) * 1000,
+};
+
+export class ResourceLimitError extends Error {
+  constructor(public code: ResourceLimitCode, message: string) {
+    super(message);
+    this.name = 'ResourceLimitError';
+  }
+}
+
 class WahyHTMLGenerator {
   private htmlParts: string[] = [];
+  private outputSize = 0;
   private pageOpened = false;
   private pageClosed = false;
   private styles: Record<string, Record<string, string>> = {};
   private listStack: string[] = [];
   private sectionStack: string[] = [];
 
+  constructor(private limits: ResourceLimits) {}
+
   reset() {
     this.htmlParts = [];
+    this.outputSize = 0;
     this.pageOpened = false;
     this.pageClosed = false;
     this.styles = {};
@@ -42,26 +86,26 @@ class WahyHTMLGenerator {
       throw new Error('الصفحة مفتوحة بالفعل');
     }
 
-    this.htmlParts.push('<!DOCTYPE html>');
-    this.htmlParts.push('<html lang="ar" dir="rtl">');
-    this.htmlParts.push('<head>');
-    this.htmlParts.push('<meta charset="UTF-8">');
-    this.htmlParts.push('<meta name="viewport" content="width=device-width, initial-scale=1.0">');
-    this.htmlParts.push(`<title>${this.escapeHtml(title)}</title>`);
-    this.htmlParts.push('<style>');
-    this.htmlParts.push('body { font-family: "Arial", sans-serif; margin: 20px; padding: 20px; }');
-    this.htmlParts.push('h1, h2, h3, h4, h5, h6 { color: #333; }');
-    this.htmlParts.push('p { line-height: 1.6; margin: 10px 0; }');
-    this.htmlParts.push('ul, ol { margin: 10px 0; padding-right: 20px; }');
-    this.htmlParts.push('li { margin: 5px 0; }');
-    this.htmlParts.push('a { color: #007bff; text-decoration: none; }');
-    this.htmlParts.push('a:hover { text-decoration: underline; }');
-    this.htmlParts.push('img { max-width: 100%; height: auto; margin: 10px 0; }');
-    this.htmlParts.push('hr { margin: 20px 0; border: none; border-top: 1px solid #ddd; }');
-    this.htmlParts.push('.section { margin: 20px 0; padding: 15px; border: 1px solid #eee; border-radius: 5px; }');
-    this.htmlParts.push('</style>');
-    this.htmlParts.push('</head>');
-    this.htmlParts.push('<body>');
+    this.emit('<!DOCTYPE html>');
+    this.emit('<html lang="ar" dir="rtl">');
+    this.emit('<head>');
+    this.emit('<meta charset="UTF-8">');
+    this.emit('<meta name="viewport" content="width=device-width, initial-scale=1.0">');
+    this.emit(`<title>${this.escapeHtml(title)}</title>`);
+    this.emit('<style>');
+    this.emit('body { font-family: "Arial", sans-serif; margin: 20px; padding: 20px; }');
+    this.emit('h1, h2, h3, h4, h5, h6 { color: #333; }');
+    this.emit('p { line-height: 1.6; margin: 10px 0; }');
+    this.emit('ul, ol { margin: 10px 0; padding-right: 20px; }');
+    this.emit('li { margin: 5px 0; }');
+    this.emit('a { color: #007bff; text-decoration: none; }');
+    this.emit('a:hover { text-decoration: underline; }');
+    this.emit('img { max-width: 100%; height: auto; margin: 10px 0; }');
+    this.emit('hr { margin: 20px 0; border: none; border-top: 1px solid #ddd; }');
+    this.emit('.section { margin: 20px 0; padding: 15px; border: 1px solid #eee; border-radius: 5px; }');
+    this.emit('</style>');
+    this.emit('</head>');
+    this.emit('<body>');
 
     this.pageOpened = true;
   }
@@ -77,29 +121,29 @@ class WahyHTMLGenerator {
     // Close any open lists
     while (this.listStack.length > 0) {
       const listType = this.listStack.pop();
-      this.htmlParts.push(`</${listType}>`);
+      this.emit(`</${listType}>`);
     }
 
     // Close any open sections
     while (this.sectionStack.length > 0) {
       this.sectionStack.pop();
-      this.htmlParts.push('</div>');
+      this.emit('</div>');
     }
 
     // Add dynamic styles
     if (Object.keys(this.styles).length > 0) {
-      this.htmlParts.push('<style>');
+      this.emit('<style>');
       for (const [selector, properties] of Object.entries(this.styles)) {
         const styleRules = Object.entries(properties)
           .map(([prop, value]) => `${prop}: ${value}`)
           .join('; ');
-        this.htmlParts.push(`${selector} { ${styleRules}; }`);
+        this.emit(`${selector} { ${styleRules}; }`);
       }
-      this.htmlParts.push('</style>');
+      this.emit('</style>');
     }
 
-    this.htmlParts.push('</body>');
-    this.htmlParts.push('</html>');
+    this.emit('</body>');
+    this.emit('</html>');
 
     this.pageClosed = true;
   }
@@ -107,7 +151,7 @@ class WahyHTMLGenerator {
   addHeading(text: string, level: number = 1) {
     this.ensurePageOpen();
     level = Math.max(1, Math.min(6, level));
-    this.htmlParts.push(`<h${level}>${this.escapeHtml(text)}</h${level}>`);
+    this.emit(`<h${level}>${this.escapeHtml(text)}</h${level}>`);
   }
 
   addSubheading(text: string) {
@@ -116,32 +160,34 @@ class WahyHTMLGenerator {
 
   addParagraph(text: string) {
     this.ensurePageOpen();
-    this.htmlParts.push(`<p>${this.escapeHtml(text)}</p>`);
+    this.emit(`<p>${this.escapeHtml(text)}</p>`);
   }
 
   addLink(text: string, url: string) {
     this.ensurePageOpen();
     const safeUrl = this.escapeHtml(url);
     const safeText = this.escapeHtml(text);
-    this.htmlParts.push(`<a href="${safeUrl}">${safeText}</a>`);
+    this.emit(`<a href="${safeUrl}">${safeText}</a>`);
   }
 
   addImage(url: string, altText: string) {
     this.ensurePageOpen();
     const safeUrl = this.escapeHtml(url);
     const safeAlt = this.escapeHtml(altText);
-    this.htmlParts.push(`<img src="${safeUrl}" alt="${safeAlt}">`);
+    this.emit(`<img src="${safeUrl}" alt="${safeAlt}">`);
   }
 
   startList() {
     this.ensurePageOpen();
-    this.htmlParts.push('<ul>');
+    this.checkNestingDepth();
+    this.emit('<ul>');
     this.listStack.push('ul');
   }
 
   startOrderedList() {
     this.ensurePageOpen();
-    this.htmlParts.push('<ol>');
+    this.checkNestingDepth();
+    this.emit('<ol>');
     this.listStack.push('ol');
   }
 
@@ -152,7 +198,7 @@ class WahyHTMLGenerator {
     }
 
     const listType = this.listStack.pop();
-    this.htmlParts.push(`</${listType}>`);
+    this.emit(`</${listType}>`);
   }
 
   addListItem(text: string) {
@@ -161,25 +207,26 @@ class WahyHTMLGenerator {
       throw new Error('لا توجد قائمة مفتوحة لإضافة عنصر إليها');
     }
 
-    this.htmlParts.push(`<li>${this.escapeHtml(text)}</li>`);
+    this.emit(`<li>${this.escapeHtml(text)}</li>`);
   }
 
   addHorizontalRule() {
     this.ensurePageOpen();
-    this.htmlParts.push('<hr>');
+    this.emit('<hr>');
   }
 
   addSpace() {
     this.ensurePageOpen();
-    this.htmlParts.push('<br>');
+    this.emit('<br>');
   }
 
   startSection(cssClass?: string) {
     this.ensurePageOpen();
+    this.checkNestingDepth();
     if (cssClass) {
-      this.htmlParts.push(`<div class="${this.escapeHtml(cssClass)}">`);
+      this.emit(`<div class="${this.escapeHtml(cssClass)}">`);
     } else {
-      this.htmlParts.push('<div class="section">');
+      this.emit('<div class="section">');
     }
     this.sectionStack.push(cssClass || 'section');
   }
@@ -191,7 +238,7 @@ class WahyHTMLGenerator {
     }
 
     this.sectionStack.pop();
-    this.htmlParts.push('</div>');
+    this.emit('</div>');
   }
 
   changeBackgroundColor(color: string) {
@@ -235,6 +282,27 @@ class WahyHTMLGenerator {
     }
   }
 
+  private emit(part: string) {
+    // Count the newline separator added by getHtml as well
+    this.outputSize += part.length + 1;
+    if (this.outputSize > this.limits.maxOutputSize) {
+      throw new ResourceLimitError(
+        'OUTPUT_SIZE_EXCEEDED',
+        `حجم الصفحة الناتجة يتجاوز الحد المسموح (${this.limits.maxOutputSize} حرف)`
+      );
+    }
+    this.htmlParts.push(part);
+  }
+
+  private checkNestingDepth() {
+    if (this.listStack.length + this.sectionStack.length + 1 > this.limits.maxNestingDepth) {
+      throw new ResourceLimitError(
+        'NESTING_DEPTH_EXCEEDED',
+        `عمق التداخل يتجاوز الحد المسموح (${this.limits.maxNestingDepth})`
+      );
+    }
+  }
+
   private escapeHtml(text: string): string {
     return text
       .replace(/&/g, '&amp;')
@@ -278,6 +346,9 @@ class WahyCommands {
         this.commandMap[command](args, generator);
         return true;
       } catch (error) {
+        if (error instanceof ResourceLimitError) {
+          throw error;
+        }
         throw new Error(`خطأ في تنفيذ الأمر "${command}": ${(error as Error).message}`);
       }
     }
@@ -394,9 +465,13 @@ class WahyCommands {
 
 export class WahyInterpreter {
   private commands = new WahyCommands();
-  private htmlGenerator = new WahyHTMLGenerator();
+  private htmlGenerator: WahyHTMLGenerator;
   private currentLine = 0;
 
+  constructor(private limits: ResourceLimits = DEFAULT_RESOURCE_LIMITS) {
+    this.htmlGenerator = new WahyHTMLGenerator(limits);
+  }
+
   parseCommand(line: string): { command: string; args: string[] } | null {
     line = line.trim();
     if (!line || line.startsWith('#')) {
@@ -458,10 +533,31 @@ export class WahyInterpreter {
   interpretCode(lines: string[]): InterpretationResult {
     this.currentLine = 0;
     this.htmlGenerator.reset();
+    const deadline = Date.now() + this.limits.maxCompileMs;
+
+    if (lines.length > this.limits.maxLines) {
+      return this.limitError(new ResourceLimitError(
+        'LINE_COUNT_EXCEEDED',
+        `عدد الأسطر (${lines.length}) يتجاوز الحد المسموح (${this.limits.maxLines})`
+      ), 0);
+    }
 
     for (let i = 0; i < lines.length; i++) {
       this.currentLine = i + 1;
 
+      if (Date.now() > deadline) {
+        return this.limitError(new ResourceLimitError(
+          'TIME_LIMIT_EXCEEDED',
+          `تجاوزت الترجمة الوقت المسموح (${this.limits.maxCompileMs / 1000} ثانية)`
+        ), this.currentLine);
+      }
+      if (lines[i].replace(/\r$/, '').length > this.limits.maxLineLength) {
+        return this.limitError(new ResourceLimitError(
+          'LINE_LENGTH_EXCEEDED',
+          `طول السطر يتجاوز الحد المسموح (${this.limits.maxLineLength} حرف)`
+        ), this.currentLine);
+      }
+
       const parsed = this.parseCommand(lines[i]);
       if (parsed === null) {
         continue;
@@ -478,6 +574,9 @@ export class WahyInterpreter {
           };
         }
       } catch (error) {
+        if (error instanceof ResourceLimitError) {
+          return this.limitError(error, this.currentLine);
+        }
         return {
           success: false,
           error: `خطأ في السطر ${this.currentLine}: ${(error as Error).message}`,
@@ -502,6 +601,15 @@ export class WahyInterpreter {
       html: htmlOutput
     };
   }
+
+  private limitError(error: ResourceLimitError, lineNumber: number): InterpretationResult {
+    return {
+      success: false,
+      error: error.message,
+      errorCode: error.code,
+      lineNumber
+    };
+  }
 }
 
 export function interpretWahyCode(code: string): InterpretationResult {
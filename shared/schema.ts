@@ -61,6 +61,13 @@ export const interpretationResultSchema = z.object({
   html: z.string().optional(),
   error: z.string().optional(),
   lineNumber: z.number().optional(),
+  errorCode: z.enum([
+    'LINE_COUNT_EXCEEDED',
+    'LINE_LENGTH_EXCEEDED',
+    'NESTING_DEPTH_EXCEEDED',
+    'OUTPUT_SIZE_EXCEEDED',
+    'TIME_LIMIT_EXCEEDED',
+  ]).optional(),
 });
 
 export type InterpretationResult = z.infer<typeof interpretationResultSchema>;